@@ -1,12 +1,375 @@
 import time
+import asyncio
+import atexit
 import functools
 import logging
+import logging.handlers
 import os
-import asyncio
+import queue
+import sys
+import threading
+import traceback
 import requests
-from datetime import datetime
+from array import array
+from collections import deque
+from weakref import WeakKeyDictionary, WeakSet
+from datetime import date, datetime
 from typing import Optional, Union, Callable, Any
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Level names accepted by Logger.log
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+# Status labels used in execution time messages
+_STATUS_OK = "✅ SUCCESS"
+_STATUS_FAIL = "❌ FAILED"
+
+# Level names accepted for Logger's log_level setting
+_CONFIG_LEVELS = {"ALL": logging.DEBUG, **_LEVELS}
+
+# Layout of every line written by Logger
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Per-thread cache of the last formatted timestamp for each date format
+_time_cache = threading.local()
+
+
+def _cached_strftime(datefmt: str, seconds: float) -> str:
+    """
+    Format a timestamp, reusing the previous result while still in the same second.
+
+    Args:
+        datefmt (str): strftime format string
+        seconds (float): Unix timestamp to format
+
+    Returns:
+        str: Formatted local time
+    """
+    sec = int(seconds)
+    cache = _time_cache.__dict__
+    cached = cache.get(datefmt)
+    if cached is not None and cached[0] == sec:
+        return cached[1]
+
+    formatted = time.strftime(datefmt, time.localtime(sec))
+    cache[datefmt] = (sec, formatted)
+    return formatted
+
+
+def _fast_hms(seconds: Optional[float] = None) -> str:
+    """Return the HH:MM:SS string for `seconds` (default: now) using the per-second cache."""
+    return _cached_strftime('%H:%M:%S', time.time() if seconds is None else seconds)
+
+
+# Display names of decorated functions, dropped automatically when the function is collected
+_FUNC_NAME_CACHE: "WeakKeyDictionary[Callable, str]" = WeakKeyDictionary()
+
+
+def _func_display_name(func: Callable) -> str:
+    """
+    Return the name used for `func` in log messages, cached per function object.
+
+    Args:
+        func (Callable): Function being decorated
+
+    Returns:
+        str: Qualified name, prefixed with the module unless defined in __main__
+    """
+    try:
+        return _FUNC_NAME_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    module = getattr(func, '__module__', None)
+    qualname = getattr(func, '__qualname__', None) or getattr(func, '__name__', repr(func))
+    name = qualname if module in (None, '__main__') else f"{module}.{qualname}"
+
+    try:
+        _FUNC_NAME_CACHE[func] = name
+    except TypeError:
+        # Objects that cannot be weakly referenced (e.g. some builtins) are simply not cached
+        pass
+    return name
+
+
+# Log directory of every logger configured by Logger, keyed by logger name
+_configured_log_dirs = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _log_filename_for(log_filename: str, day_ordinal: int) -> str:
+    """Build the dated log filename, memoized for the most recent (name, day) pair."""
+    return f"{log_filename}_{date.fromordinal(day_ordinal).strftime('%Y-%m-%d')}.log"
+
+
+class _CallStats:
+    """
+    Running call statistics for one function decorated with time_logger(aggregate=True).
+
+    Call, failure and total-time counters cover every call; only the most recent
+    `max_samples` durations are kept for the percentile.
+    """
+
+    __slots__ = ('func_name', 'calls', 'fails', 'total_ns', 'samples', 'lock', '__weakref__')
+
+    def __init__(self, func_name: str, max_samples: int = 1024):
+        self.func_name = func_name
+        self.calls = 0
+        self.fails = 0
+        self.total_ns = 0
+        self.samples = deque(maxlen=max_samples)
+        self.lock = threading.Lock()
+
+    def record(self, execution_ns: int, success: bool):
+        """Add one call to the running totals."""
+        with self.lock:
+            self.calls += 1
+            self.total_ns += execution_ns
+            if not success:
+                self.fails += 1
+            self.samples.append(execution_ns)
+
+    def drain(self) -> tuple:
+        """Return (calls, fails, total_ns, samples) accumulated so far and reset them."""
+        with self.lock:
+            snapshot = (self.calls, self.fails, self.total_ns, array('q', self.samples))
+            self.calls = self.fails = self.total_ns = 0
+            self.samples.clear()
+        return snapshot
+
+
+class CachedFormatter(logging.Formatter):
+    """
+    A formatter that only rebuilds the timestamp string once per second.
+
+    Records using the standard Logger layout are assembled directly with an
+    f-string instead of going through %-style substitution.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, taking the direct path for the standard layout."""
+        if self._fmt != _LOG_FORMAT or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        return f"{self.formatTime(record, self.datefmt)} - {record.name} - {record.levelname} - {record.getMessage()}"
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record creation time, served from the per-second cache."""
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        return _cached_strftime(datefmt, record.created)
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    A dated log file handler that buffers records in memory and appends them with os.write.
+
+    The file is opened with O_APPEND, so every write lands atomically at the end
+    of the file even when several processes share it. The buffer is written out
+    immediately for WARNING and above, once it grows past `buffer_size`, and
+    otherwise on a fixed interval so that anyone tailing the file still sees
+    progress. On every periodic flush the current date is compared with the open
+    file's date and a new dated file is opened when it changes, so rotation
+    happens within one flush interval without any work on the logging path.
+    """
+
+    terminator = "\n"
+
+    def __init__(self, log_dir: str, log_filename: str, buffer_size: int = 65536,
+                 flush_interval: float = 0.5):
+        """
+        Initialize the buffered file handler.
+
+        Args:
+            log_dir (str): Directory holding the log files
+            log_filename (str): Base name for the log file (without extension)
+            buffer_size (int): Bytes to buffer before writing (default: 64 KB)
+            flush_interval (float): Seconds between periodic flushes and date checks (default: 0.5)
+        """
+        super().__init__()
+        self.log_dir = log_dir
+        self.log_filename = log_filename
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self._buffer = bytearray()
+        self._day = date.today().toordinal()
+        self.baseFilename = os.path.join(log_dir, _log_filename_for(log_filename, self._day))
+        self._fd = self._open()
+
+        # Periodically flush the buffer in the background
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _open(self, path: Optional[str] = None) -> int:
+        """Open `path` (default: the current log file) for atomic appends."""
+        return os.open(path or self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _write_buffer(self):
+        """
+        Write out everything buffered so far. Caller must hold the handler lock.
+
+        The buffer is emptied even if the write fails, so a broken file drops
+        the pending records once instead of growing and failing on every flush.
+        """
+        if not self._buffer or self._fd is None:
+            return
+        view = memoryview(self._buffer)
+        try:
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        finally:
+            view.release()
+            self._buffer.clear()
+
+    def _maybe_rotate(self):
+        """Switch to a new dated file if the day has changed. Caller must hold the handler lock."""
+        today = date.today().toordinal()
+        if today == self._day:
+            return
+
+        # Open the new file first so a failure leaves the current fd untouched and retried later
+        path = os.path.join(self.log_dir, _log_filename_for(self.log_filename, today))
+        new_fd = self._open(path)
+
+        old_fd = self._fd
+        try:
+            self._write_buffer()
+        finally:
+            self._fd = new_fd
+            self._day = today
+            self.baseFilename = path
+            if old_fd is not None:
+                os.close(old_fd)
+
+    def _flush_periodically(self):
+        """Rotate if the day changed and flush, every `flush_interval` seconds until closed."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                with self.lock:
+                    if self._fd is None:
+                        continue
+                    self._maybe_rotate()
+                    self._write_buffer()
+            except Exception:
+                # Keep the flusher alive; report the failure like logging.Handler.handleError
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+    def emit(self, record: logging.LogRecord):
+        """Buffer the record, writing out immediately for WARNING and above."""
+        try:
+            self._buffer += (self.format(record) + self.terminator).encode("utf-8")
+            if record.levelno >= logging.WARNING or len(self._buffer) >= self.buffer_size:
+                self._write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Write out any buffered records."""
+        with self.lock:
+            self._write_buffer()
+
+    def close(self):
+        """Stop the periodic flusher, write out the buffer and close the file."""
+        self._stop_event.set()
+        with self.lock:
+            self._write_buffer()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        super().close()
+
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """
+    A console handler that collects formatted records and writes them in batches.
+
+    Buffered text is joined and written every `flush_interval` seconds or once
+    it grows past `max_buffer` characters. WARNING and above are written
+    immediately, after anything already buffered, so ordering is preserved.
+    """
+
+    def __init__(self, stream=None, flush_interval: float = 0.02, max_buffer: int = 16384):
+        """
+        Initialize the batched stream handler.
+
+        Args:
+            stream: Stream to write to (default: sys.stderr)
+            flush_interval (float): Seconds between batched writes (default: 0.02)
+            max_buffer (int): Buffered characters that trigger an early write (default: 16384)
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+
+        self._buffer = []
+        self._buffered = 0
+
+        # Write out the batch in the background
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _write_buffer(self):
+        """
+        Write the joined batch to the stream. Caller must hold the handler lock.
+
+        The batch is dropped even if the write fails, so a broken stream loses
+        the pending records once instead of holding them in memory for good.
+        """
+        if not self._buffer:
+            return
+        try:
+            self.stream.write("".join(self._buffer))
+            self.stream.flush()
+        finally:
+            self._buffer.clear()
+            self._buffered = 0
+
+    def _flush_periodically(self):
+        """Flush the batch every `flush_interval` seconds until the handler is closed."""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # Keep the flusher alive; report the failure like logging.Handler.handleError
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+    def emit(self, record: logging.LogRecord):
+        """Buffer the record, writing out immediately for WARNING and above."""
+        try:
+            msg = self.format(record) + self.terminator
+            self._buffer.append(msg)
+            self._buffered += len(msg)
+            if record.levelno >= logging.WARNING or self._buffered >= self.max_buffer:
+                self._write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Write out any buffered records."""
+        with self.lock:
+            self._write_buffer()
+
+    def close(self):
+        """Stop the periodic flusher and write out the remaining batch."""
+        self._stop_event.set()
+        self.flush()
+        super().close()
+
 
 class Logger:
     """
@@ -21,22 +384,43 @@ class Logger:
             log_filename (str): Base name for the log file (without extension)
             log_level (str): Log level filter - 'debug', 'info', 'warning', 'error', 'critical', or 'all'
             log_dir (str): Directory to store log files (default: 'logs')
+
+        If a Logger with the same log_filename was already created today, this
+        instance shares its handlers, level and log directory; a differing
+        log_level or log_dir is not applied and a warning is logged instead.
         """
         self.log_filename = log_filename
         self.log_level = log_level.upper()
         self.log_dir = log_dir
         self.logger = None
-
-        # Create log directory if it doesn't exist
-        self._create_log_directory()
-
-        # Setup the logger
+        self._today = date.today()
+
+        # Records are handed off through a queue and written by a background listener
+        self._queue = None
+        self._listener = None
+        self._level = logging.DEBUG
+
+        # Per-function call statistics summarised periodically by a background thread;
+        # held weakly so they disappear together with the decorated function
+        self._call_stats = WeakSet()
+        self._stats_lock = threading.Lock()
+        self._aggregator = None
+        self._aggregate_interval = 1.0
+
+        # Reuse HTTP connections across measured API calls
+        self._session = None
+        self._executor = None
+        self._http_lock = threading.Lock()
+        self._aio_sessions = WeakKeyDictionary()
+        self._aio_lock = threading.Lock()
+        self._aio_exit_hook = False
+
+        # Setup the logger (creating the log directory when a new one is configured)
         self._setup_logger()
 
     def _create_log_directory(self):
         """Create the log directory if it doesn't exist."""
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
 
     def _get_log_filename_with_timestamp(self) -> str:
         """
@@ -45,65 +429,89 @@ class Logger:
         Returns:
             str: Formatted filename with timestamp
         """
-        current_time = datetime.now().strftime("%Y-%m-%d")
-        return f"{self.log_filename}_{current_time}.log"
+        return _log_filename_for(self.log_filename, self._today.toordinal())
 
     def _setup_logger(self):
         """Setup the logger with appropriate handlers and formatters."""
         # Create a unique logger name to avoid conflicts
-        logger_name = f"{self.log_filename}_{datetime.now().strftime('%Y%m%d')}"
-        self.logger = logging.getLogger(logger_name)
+        logger_name = f"{self.log_filename}_{self._today.strftime('%Y%m%d')}"
+
+        # Reuse a logger that an earlier instance already configured, keeping its handlers and level
+        existing = logging.Logger.manager.loggerDict.get(logger_name)
+        if isinstance(existing, logging.Logger) and existing.handlers:
+            self.logger = existing
+            self._level = existing.level
+            self._warn_if_reconfigured(logger_name)
+            return
 
-        # Clear any existing handlers
-        self.logger.handlers.clear()
+        # Create log directory if it doesn't exist
+        self._create_log_directory()
+        _configured_log_dirs[logger_name] = self.log_dir
 
-        # Set the base logger level to DEBUG to capture all logs
-        self.logger.setLevel(logging.DEBUG)
+        self.logger = logging.getLogger(logger_name)
 
         # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        formatter = CachedFormatter(
+            _LOG_FORMAT,
             datefmt='%Y-%m-%d %H:%M:%S'
         )
 
         # Create file handler with timestamp
         log_file_path = os.path.join(self.log_dir, self._get_log_filename_with_timestamp())
-        file_handler = logging.FileHandler(log_file_path)
+        file_handler = BufferedFileHandler(self.log_dir, self.log_filename)
         file_handler.setFormatter(formatter)
 
         # Create console handler for real-time monitoring
-        console_handler = logging.StreamHandler()
+        console_handler = BatchedStreamHandler()
         console_handler.setFormatter(formatter)
 
         # Set log level for handlers based on user input
-        if self.log_level == "ALL":
-            file_handler.setLevel(logging.DEBUG)
-            console_handler.setLevel(logging.DEBUG)
-        else:
-            level_mapping = {
-                "DEBUG": logging.DEBUG,
-                "INFO": logging.INFO,
-                "WARNING": logging.WARNING,
-                "ERROR": logging.ERROR,
-                "CRITICAL": logging.CRITICAL
-            }
+        level_mapping = _CONFIG_LEVELS
+
+        # Default to INFO if invalid level provided
+        handler_level = level_mapping.get(self.log_level, logging.INFO)
 
-            if self.log_level in level_mapping:
-                file_handler.setLevel(level_mapping[self.log_level])
-                console_handler.setLevel(level_mapping[self.log_level])
-            else:
-                # Default to INFO if invalid level provided
-                file_handler.setLevel(logging.INFO)
-                console_handler.setLevel(logging.INFO)
-                self.logger.warning(f"Invalid log level '{self.log_level}'. Using INFO level.")
+        file_handler.setLevel(handler_level)
+        console_handler.setLevel(handler_level)
 
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Match the logger level to the handlers so filtered records are rejected
+        # before any message formatting happens
+        self.logger.setLevel(handler_level)
+        self._level = handler_level
+
+        if self.log_level not in level_mapping:
+            self.logger.warning(f"Invalid log level '{self.log_level}'. Using INFO level.")
+
+        # Run the real handlers on a background thread so callers never block on I/O
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            self._queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+        # Only the non-blocking queue handler is attached to the logger
+        self.logger.addHandler(logging.handlers.QueueHandler(self._queue))
 
         # Log initialization message
-        self.logger.info(f"Logger initialized with level: {self.log_level}")
-        self.logger.info(f"Log file: {log_file_path}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Logger initialized with level: %s", self.log_level)
+            self.logger.debug("Log file: %s", log_file_path)
+
+    def _warn_if_reconfigured(self, logger_name: str):
+        """Warn when a reused logger ignores the level or directory requested for this instance."""
+        requested_level = _CONFIG_LEVELS.get(self.log_level, logging.INFO)
+        active_dir = _configured_log_dirs.get(logger_name, self.log_dir)
+
+        ignored = []
+        if requested_level != self._level:
+            ignored.append(f"level '{self.log_level}' (active: {logging.getLevelName(self._level)})")
+        if os.path.abspath(self.log_dir) != os.path.abspath(active_dir):
+            ignored.append(f"log_dir '{self.log_dir}' (active: '{active_dir}')")
+
+        if ignored:
+            self.logger.warning(f"Logger '{logger_name}' is already configured; ignoring requested "
+                                f"{' and '.join(ignored)}")
 
     def debug(self, message: str):
         """Log a debug message."""
@@ -133,108 +541,174 @@ class Logger:
             level (str): Log level ('debug', 'info', 'warning', 'error', 'critical')
             message (str): Message to log
         """
-        level = level.upper()
-        level_methods = {
-            "DEBUG": self.debug,
-            "INFO": self.info,
-            "WARNING": self.warning,
-            "ERROR": self.error,
-            "CRITICAL": self.critical
-        }
-
-        if level in level_methods:
-            level_methods[level](message)
+        lvl = _LEVELS.get(level.upper())
+        if lvl is None:
+            self.logger.warning(f"Invalid log level '{level.upper()}'. Message: {message}")
         else:
-            self.warning(f"Invalid log level '{level}'. Message: {message}")
+            self.logger.log(lvl, message)
 
-    def time_logger(self, include_args: bool = False, threshold_seconds: Optional[float] = None):
+    def time_logger(self, include_args: bool = False, threshold_seconds: Optional[float] = None,
+                    aggregate: bool = False):
         """
         Decorator to measure execution time of functions.
 
         Args:
             include_args (bool): Whether to log function arguments
             threshold_seconds (float): Only log if execution time exceeds this threshold
+            aggregate (bool): Collect call statistics and log one summary line per second
+                instead of one line per call (include_args and threshold_seconds are ignored)
+
+        Only Exception subclasses are logged as failed calls; SystemExit,
+        KeyboardInterrupt and GeneratorExit propagate without a FAILED line.
         """
         def decorator(func: Callable) -> Callable:
+            # Resolve everything that does not change between calls once, at decoration time
+            func_name = _func_display_name(func)
+
+            if aggregate:
+                stats = _CallStats(func_name)
+                _record = stats.record
+                _perf_ns = time.perf_counter_ns
+
+                @functools.wraps(func)
+                def aggregated_wrapper(*args, **kwargs):
+                    start_ns = _perf_ns()
+                    success = False
+                    try:
+                        result = func(*args, **kwargs)
+                        success = True
+                        return result
+                    finally:
+                        # Only Exception counts as a failed call; exits and interrupts are not recorded
+                        if success or isinstance(sys.exc_info()[1], Exception):
+                            _record(_perf_ns() - start_ns, success)
+
+                aggregated_wrapper._stats = stats
+                self._register_stats(stats)
+                return aggregated_wrapper
+
+            threshold_ns = int((threshold_seconds or 0.0) * 1e9)
+            _clock_ns = time.perf_counter_ns
+            _wall = time.time
+            _debug = self.logger.debug
+            _isdbg = self.logger.isEnabledFor
+            _log_exec = self._log_execution_time
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                func_name = f"{func.__module__}.{func.__name__}" if func.__module__ != '__main__' else func.__name__
-
-                # Log function start
-                start_msg = f"🚀 Starting execution: {func_name}"
-                if include_args:
-                    start_msg += f" | Args: {args} | Kwargs: {kwargs}"
-
-                self.logger.debug(start_msg)
-
-                # Measure execution time
-                start_time = time.perf_counter()
-                start_timestamp = datetime.now()
+                # Log function start, only paying for formatting when DEBUG is enabled
+                if _isdbg(logging.DEBUG):
+                    if include_args:
+                        _debug("🚀 Starting execution: %s | Args: %r | Kwargs: %r",
+                               func_name, args, kwargs)
+                    else:
+                        _debug("🚀 Starting execution: %s", func_name)
+
+                # Measure execution time in integer nanoseconds
+                start_ns = _clock_ns()
+                start_wall = _wall()
+                success = False
 
                 try:
                     result = func(*args, **kwargs)
-
-                    # Calculate execution time
-                    end_time = time.perf_counter()
-                    execution_time = end_time - start_time
-
-                    # Log successful completion
-                    self._log_execution_time(func_name, execution_time, start_timestamp, True)
-
+                    success = True
                     return result
 
-                except Exception as e:
-                    # Calculate execution time for failed function
-                    end_time = time.perf_counter()
-                    execution_time = end_time - start_time
-
-                    # Log failed execution
-                    self._log_execution_time(func_name, execution_time, start_timestamp, False, str(e))
-
-                    # Re-raise the exception
-                    raise
+                finally:
+                    # Exceptions propagate through here untouched; only calls at or
+                    # above the threshold pay for formatting
+                    execution_ns = _clock_ns() - start_ns
+                    if execution_ns >= threshold_ns:
+                        try:
+                            if success:
+                                _log_exec(func_name, execution_ns / 1e9, start_wall, True)
+                            else:
+                                error = sys.exc_info()[1]
+                                # Exits and interrupts are not failures of the function
+                                if isinstance(error, Exception):
+                                    _log_exec(func_name, execution_ns / 1e9, start_wall, False, str(error))
+                        except Exception:
+                            # A logging problem must never replace the call's own result or exception
+                            if logging.raiseExceptions:
+                                traceback.print_exc(file=sys.stderr)
 
             return wrapper
 
         return decorator
 
+    def _register_stats(self, stats: _CallStats):
+        """Track a function's call statistics and start the summary thread on first use."""
+        with self._stats_lock:
+            self._call_stats.add(stats)
+
+            if self._aggregator is None:
+                self._aggregator = threading.Thread(target=self._aggregate_periodically, daemon=True)
+                self._aggregator.start()
+                atexit.register(self._flush_aggregates)
+
+    def _aggregate_periodically(self):
+        """Emit summaries for all registered functions every `_aggregate_interval` seconds."""
+        while True:
+            time.sleep(self._aggregate_interval)
+            self._flush_aggregates()
+
+    def _flush_aggregates(self):
+        """Drain every registered function's statistics and log one summary line each."""
+        with self._stats_lock:
+            registered = list(self._call_stats)
+
+        for stats in registered:
+            n, fails, total_ns, samples = stats.drain()
+            if not n:
+                continue
+
+            mean_ms = total_ns / n / 1e6
+            p99 = sorted(samples)[int(0.99 * (len(samples) - 1))] / 1e6
+            msg = "📊 %s | n=%d | mean=%.2fms | p99=%.2fms | fails=%d"
+            args = [stats.func_name, n, mean_ms, p99, fails]
+            if len(samples) < n:
+                # The percentile only covers the most recent calls
+                msg += " | p99 sampled from last %d calls"
+                args.append(len(samples))
+
+            self.logger.log(logging.ERROR if fails else self._level, msg, *args)
+
     def _log_execution_time(self, func_name: str, execution_time: float,
-                          start_timestamp: datetime, success: bool, error_msg: str = None):
+                          start_wall: float, success: bool, error_msg: str = None,
+                          threshold_seconds: float = 0.0):
         """Log the execution time with detailed information."""
         # Check threshold
-        if self.threshold_seconds and execution_time < self.threshold_seconds:
+        if execution_time < threshold_seconds:
             return
 
-        # Format execution time
-        if execution_time < 1:
-            time_str = f"{execution_time * 1000:.2f}ms"
-        elif execution_time < 60:
-            time_str = f"{execution_time:.3f}s"
-        else:
-            minutes = int(execution_time // 60)
-            seconds = execution_time % 60
-            time_str = f"{minutes}m {seconds:.3f}s"
-
-        # Create status indicator
-        status = "✅ SUCCESS" if success else "❌ FAILED"
-
-        # Build log message
-        log_msg = f"{status} | Function: {func_name} | Execution Time: {time_str} | Started: {start_timestamp.strftime('%H:%M:%S')}"
-
-        if not success and error_msg:
-            log_msg += f" | Error: {error_msg}"
-
         # Determine log level based on execution time and success
         if not success:
-            log_level = 'error'
+            log_level = logging.ERROR
         elif execution_time > 10:  # Slow execution
-            log_level = 'warning'
+            log_level = logging.WARNING
         elif execution_time > 5:  # Moderate execution
-            log_level = 'info'
+            log_level = logging.INFO
         else:
-            log_level = self.log_level.lower()
+            log_level = self._level
+
+        if not self.logger.isEnabledFor(log_level):
+            return
+
+        # Format execution time
+        ms = execution_time * 1000.0
+        time_str = f"{ms:.2f}ms" if ms < 1000 else (
+            f"{execution_time:.3f}s" if execution_time < 60
+            else f"{execution_time // 60:.0f}m {execution_time % 60:.3f}s"
+        )
 
-        self.log(log_level, log_msg)
+        # Build log message
+        parts = [_STATUS_OK if success else _STATUS_FAIL, " | Function: ", func_name,
+                 " | Execution Time: ", time_str, " | Started: ", _fast_hms(start_wall)]
+        if not success and error_msg:
+            parts += (" | Error: ", error_msg)
+        log_msg = "".join(parts)
+
+        self.logger.log(log_level, log_msg)
 
     def measure_api_call(self, url: str, method: str = "GET", **kwargs) -> dict:
         """
@@ -249,46 +723,216 @@ class Logger:
             dict: Response data with timing information
         """
         start_time = time.perf_counter()
-        start_timestamp = datetime.now()
+        start_wall = time.time()
 
         try:
-            self.logger.info(f"🌐 API Call Started: {method} {url}")
+            self.logger.info("🌐 API Call Started: %s %s", method, url)
 
             # Make the API call
-            response = requests.request(method, url, **kwargs)
+            response = self._get_session().request(method, url, **kwargs)
 
             # Calculate timing
             end_time = time.perf_counter()
             execution_time = end_time - start_time
 
-            # Format time
-            if execution_time < 1:
-                time_str = f"{execution_time * 1000:.2f}ms"
-            else:
-                time_str = f"{execution_time:.3f}s"
-
             # Log result
-            status_icon = "✅" if response.status_code < 400 else "❌"
-            self.logger.info(f"{status_icon} API Response: {method} {url} | "
-                           f"Status: {response.status_code} | "
-                           f"Time: {time_str} | "
-                           f"Size: {len(response.content)} bytes")
+            if self.logger.isEnabledFor(logging.INFO):
+                # Format time
+                if execution_time < 1:
+                    time_str = f"{execution_time * 1000:.2f}ms"
+                else:
+                    time_str = f"{execution_time:.3f}s"
+
+                status_icon = "✅" if response.status_code < 400 else "❌"
+                self.logger.info("%s API Response: %s %s | Status: %s | Time: %s | Size: %d bytes",
+                                 status_icon, method, url, response.status_code,
+                                 time_str, len(response.content))
 
             return {
                 'response': response,
                 'execution_time': execution_time,
                 'status_code': response.status_code,
-                'start_time': start_timestamp,
-                'end_time': datetime.now()
+                'start_time': datetime.fromtimestamp(start_wall),
+                'end_time': datetime.fromtimestamp(start_wall + execution_time)
             }
 
         except Exception as e:
             end_time = time.perf_counter()
             execution_time = end_time - start_time
-            time_str = f"{execution_time * 1000:.2f}ms" if execution_time < 1 else f"{execution_time:.3f}s"
+            if self.logger.isEnabledFor(logging.ERROR):
+                time_str = f"{execution_time * 1000:.2f}ms" if execution_time < 1 else f"{execution_time:.3f}s"
+                self.logger.error("❌ API Call Failed: %s %s | Time: %s | Error: %s",
+                                  method, url, time_str, e)
+
+            raise
+
+    async def measure_api_call_async(self, url: str, method: str = "GET", session=None, **kwargs) -> dict:
+        """
+        Measure time for API calls using aiohttp, without blocking the event loop.
+
+        Args:
+            url: API endpoint URL
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            session: Optional aiohttp.ClientSession to use instead of the shared one
+            **kwargs: Additional arguments for aiohttp
 
-            self.logger.error(f"❌ API Call Failed: {method} {url} | "
-                            f"Time: {time_str} | "
-                            f"Error: {str(e)}")
+        Returns:
+            dict: Response data with timing information
+        """
+        if session is None:
+            session = await self._get_aio_session()
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        start_wall = time.time()
+
+        try:
+            self.logger.info("🌐 API Call Started: %s %s", method, url)
+
+            # Make the API call and read the body while the connection is open
+            async with session.request(method, url, **kwargs) as response:
+                content = await response.read()
+
+            # Calculate timing
+            execution_time = loop.time() - start_time
+
+            # Log result
+            if self.logger.isEnabledFor(logging.INFO):
+                # Format time
+                if execution_time < 1:
+                    time_str = f"{execution_time * 1000:.2f}ms"
+                else:
+                    time_str = f"{execution_time:.3f}s"
+
+                status_icon = "✅" if response.status < 400 else "❌"
+                self.logger.info("%s API Response: %s %s | Status: %s | Time: %s | Size: %d bytes",
+                                 status_icon, method, url, response.status,
+                                 time_str, len(content))
+
+            return {
+                'response': response,
+                'content': content,
+                'execution_time': execution_time,
+                'status_code': response.status,
+                'start_time': datetime.fromtimestamp(start_wall),
+                'end_time': datetime.fromtimestamp(start_wall + execution_time)
+            }
+
+        except Exception as e:
+            execution_time = loop.time() - start_time
+            if self.logger.isEnabledFor(logging.ERROR):
+                time_str = f"{execution_time * 1000:.2f}ms" if execution_time < 1 else f"{execution_time:.3f}s"
+                self.logger.error("❌ API Call Failed: %s %s | Time: %s | Error: %s",
+                                  method, url, time_str, e)
 
             raise
+
+    async def _get_aio_session(self):
+        """
+        Return the shared aiohttp session for the running loop.
+
+        A session is bound to the loop that created it, so one session is kept
+        per loop. Sessions whose loop has been closed are dropped and closed;
+        sessions of loops still running in other threads are left alone.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aio_lock:
+            stale = [(other, old) for other, old in self._aio_sessions.items() if other.is_closed()]
+            for other, _ in stale:
+                del self._aio_sessions[other]
+
+            session = self._aio_sessions.get(loop)
+            if session is None or session.closed:
+                import aiohttp
+                if not self._aio_exit_hook:
+                    atexit.register(self._close_aio_sessions_at_exit)
+                    self._aio_exit_hook = True
+                session = aiohttp.ClientSession()
+                self._aio_sessions[loop] = session
+
+        for _, old in stale:
+            if not old.closed:
+                # Its loop is closed, so aiohttp releases it without scheduling anything on that loop
+                try:
+                    await old.close()
+                except Exception:
+                    pass
+        return session
+
+    async def close_async_session(self):
+        """Close the shared aiohttp session of the running loop used by measure_api_call_async."""
+        with self._aio_lock:
+            session = self._aio_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _close_aio_sessions_at_exit(self):
+        """Best-effort close of shared aiohttp sessions still open at interpreter exit."""
+        with self._aio_lock:
+            sessions = list(self._aio_sessions.items())
+            self._aio_sessions.clear()
+
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            try:
+                if loop.is_closed():
+                    asyncio.run(session.close())
+                elif not loop.is_running():
+                    loop.run_until_complete(session.close())
+                # A loop still running in another thread owns its session; leave it be
+            except Exception:
+                pass
+
+    def _get_session(self) -> requests.Session:
+        """Return the shared requests session, creating it on first use."""
+        if self._session is None:
+            with self._http_lock:
+                if self._session is None:
+                    self._session = requests.Session()
+                    atexit.register(self.close_http)
+        return self._session
+
+    def close_http(self):
+        """Shut down the thread pool and close the requests session used for API calls."""
+        with self._http_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def measure_api_calls(self, urls: list, method: str = "GET", max_workers: int = 16, **kwargs) -> list:
+        """
+        Measure several API calls concurrently over the shared session.
+
+        Args:
+            urls: API endpoint URLs
+            method: HTTP method applied to every call
+            max_workers: Size of the shared thread pool (used when it is first created)
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            list: Result of measure_api_call, or the raised exception, for each URL in input order
+        """
+        self._get_session()
+        with self._http_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            executor = self._executor
+
+        futures = {
+            executor.submit(self.measure_api_call, url, method, **kwargs): index
+            for index, url in enumerate(urls)
+        }
+
+        results = [None] * len(futures)
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = e
+
+        return results